@@ -1,6 +1,167 @@
+import argparse
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import csv
+import heapq
+import os
+import zlib
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Timestamps travel to workers as integer microseconds since this epoch, which pickle far cheaper
+EVENT_EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Full-precision datetimes kept for the flat export; the JSON keeps only the HH:MM:SS strings
+JSON_EXCLUDED_SESSION_KEYS = ('login_timestamp', 'logout_timestamp')
+
+SESSION_COLUMNS = [
+    'student_id', 'date', 'session_number', 'computer_name',
+    'login_timestamp', 'logout_timestamp', 'duration_minutes', 'duration_hours', 'status'
+]
+
+def build_day_record(date, logins, logouts):
+    """Pair one student's logins and logouts for a single date into a day record"""
+    sessions = []
+    logout_index = 0
+    
+    for i, login in enumerate(logins):
+        session = {
+            'session_number': i + 1,
+            'computer_name': login['computer_name'],
+            'login_time': login['timestamp'].strftime("%H:%M:%S"),
+            'logout_time': None,
+            'login_timestamp': login['timestamp'],
+            'logout_timestamp': None,
+            'duration_minutes': 0,
+            'duration_hours': 0.0,
+            'status': 'incomplete'
+        }
+        
+        while logout_index < len(logouts) and logouts[logout_index]['timestamp'] <= login['timestamp']:
+            logout_index += 1
+        
+        if logout_index < len(logouts):
+            logout = logouts[logout_index]
+            session['logout_time'] = logout['timestamp'].strftime("%H:%M:%S")
+            session['logout_timestamp'] = logout['timestamp']
+            
+            duration = logout['timestamp'] - login['timestamp']
+            session['duration_minutes'] = int(duration.total_seconds() / 60)
+            session['duration_hours'] = round(duration.total_seconds() / 3600, 2)
+            session['status'] = 'complete'
+            logout_index += 1
+        
+        sessions.append(session)
+    
+    while logout_index < len(logouts):
+        logout = logouts[logout_index]
+        session = {
+            'session_number': len(sessions) + 1,
+            'computer_name': logout['computer_name'],
+            'login_time': None,
+            'logout_time': logout['timestamp'].strftime("%H:%M:%S"),
+            'login_timestamp': None,
+            'logout_timestamp': logout['timestamp'],
+            'duration_minutes': 0,
+            'duration_hours': 0.0,
+            'status': 'logout_only'
+        }
+        sessions.append(session)
+        logout_index += 1
+    
+    if sessions:
+        total_minutes = sum(s['duration_minutes'] for s in sessions if s['status'] == 'complete')
+        total_hours = round(total_minutes / 60, 2)
+        return {
+            'date': date,
+            'weekday': logins[0]['weekday'] if logins else (logouts[0]['weekday'] if logouts else None),
+            'total_sessions': len(sessions),
+            'completed_sessions': len([s for s in sessions if s['status'] == 'complete']),
+            'total_duration_minutes': total_minutes,
+            'total_duration_hours': total_hours,
+            'sessions': sessions
+        }
+    return None
+
+
+def sessionize(login_data, logout_data):
+    """Group events by (student_id, date) and return day records sorted by key"""
+    login_data.sort(key=lambda x: (x['student_id'], x['date'], x['timestamp']))
+    logout_data.sort(key=lambda x: (x['student_id'], x['date'], x['timestamp']))
+    
+    login_by_student_date = defaultdict(list)
+    logout_by_student_date = defaultdict(list)
+    
+    for login in login_data:
+        key = (login['student_id'], login['date'])
+        login_by_student_date[key].append(login)
+    
+    for logout in logout_data:
+        key = (logout['student_id'], logout['date'])
+        logout_by_student_date[key].append(logout)
+    
+    all_keys = set(login_by_student_date.keys()) | set(logout_by_student_date.keys())
+    
+    records = []
+    for student_id, date in sorted(all_keys):
+        day_record = build_day_record(
+            date,
+            login_by_student_date.get((student_id, date), []),
+            logout_by_student_date.get((student_id, date), [])
+        )
+        if day_record:
+            records.append((student_id, date, day_record))
+    return records
+
+
+def partition_by_student(data, num_partitions):
+    """Hash-partition events by student ID so each student lands in exactly one partition
+
+    Events are packed as (computer_name, student_id, microseconds) tuples to keep the cost
+    of sending them to worker processes down; date and weekday are rebuilt in the worker.
+    """
+    partitions = [[] for _ in range(num_partitions)]
+    for entry in data:
+        index = zlib.crc32(entry['student_id'].encode('utf-8')) % num_partitions
+        micros = (entry['timestamp'] - EVENT_EPOCH) // ONE_MICROSECOND
+        partitions[index].append((entry['computer_name'], entry['student_id'], micros))
+    return partitions
+
+
+def unpack_events(rows):
+    events = []
+    for computer_name, student_id, micros in rows:
+        timestamp = EVENT_EPOCH + timedelta(microseconds=micros)
+        events.append({
+            'computer_name': computer_name,
+            'student_id': student_id,
+            'timestamp': timestamp,
+            'date': timestamp.date().strftime("%Y-%m-%d"),
+            'weekday': timestamp.strftime("%A")
+        })
+    return events
+
+
+def sessionize_partition(login_rows, logout_rows):
+    """Worker entry point: unpack one partition's event tuples and sessionize them"""
+    return sessionize(unpack_events(login_rows), unpack_events(logout_rows))
+
+
+def remove_partial_file(filepath):
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
+
 
 class StudentSessionTracker:
     def __init__(self):
@@ -93,83 +254,31 @@ class StudentSessionTracker:
         self.login_data = unique_entries_with_tolerance(self.login_data)
         self.logout_data = unique_entries_with_tolerance(self.logout_data)
 
-    def calculate_sessions(self):
-        self.login_data.sort(key=lambda x: (x['student_id'], x['date'], x['timestamp']))
-        self.logout_data.sort(key=lambda x: (x['student_id'], x['date'], x['timestamp']))
-        
-        login_by_student_date = defaultdict(list)
-        logout_by_student_date = defaultdict(list)
-        
-        for login in self.login_data:
-            key = (login['student_id'], login['date'])
-            login_by_student_date[key].append(login)
-        
-        for logout in self.logout_data:
-            key = (logout['student_id'], logout['date'])
-            logout_by_student_date[key].append(logout)
+    def calculate_sessions(self, workers=1):
+        """Build per-student day records; workers > 1 sessionizes student partitions in parallel
+
+        If the worker pool cannot be started or breaks, falls back to the serial path.
+        """
+        records = None
+        if workers and workers > 1:
+            login_parts = partition_by_student(self.login_data, workers)
+            logout_parts = partition_by_student(self.logout_data, workers)
+            
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    partial_records = list(executor.map(sessionize_partition, login_parts, logout_parts))
+            except (BrokenProcessPool, OSError) as e:
+                print(f"Parallel sessionization failed ({e}), running serially instead.")
+            else:
+                # Each partition is already sorted by (student_id, date), so a k-way merge
+                # reproduces the serial order without re-sorting every record
+                records = heapq.merge(*partial_records, key=lambda x: (x[0], x[1]))
         
-        all_keys = set(login_by_student_date.keys()) | set(logout_by_student_date.keys())
+        if records is None:
+            records = sessionize(self.login_data, self.logout_data)
         
-        for student_id, date in all_keys:
-            logins = login_by_student_date.get((student_id, date), [])
-            logouts = logout_by_student_date.get((student_id, date), [])
-            
-            sessions = []
-            logout_index = 0
-            
-            for i, login in enumerate(logins):
-                session = {
-                    'session_number': i + 1,
-                    'computer_name': login['computer_name'],
-                    'login_time': login['timestamp'].strftime("%H:%M:%S"),
-                    'logout_time': None,
-                    'duration_minutes': 0,
-                    'duration_hours': 0.0,
-                    'status': 'incomplete'
-                }
-                
-                while logout_index < len(logouts) and logouts[logout_index]['timestamp'] <= login['timestamp']:
-                    logout_index += 1
-                
-                if logout_index < len(logouts):
-                    logout = logouts[logout_index]
-                    session['logout_time'] = logout['timestamp'].strftime("%H:%M:%S")
-                    
-                    duration = logout['timestamp'] - login['timestamp']
-                    session['duration_minutes'] = int(duration.total_seconds() / 60)
-                    session['duration_hours'] = round(duration.total_seconds() / 3600, 2)
-                    session['status'] = 'complete'
-                    logout_index += 1
-                
-                sessions.append(session)
-            
-            while logout_index < len(logouts):
-                logout = logouts[logout_index]
-                session = {
-                    'session_number': len(sessions) + 1,
-                    'computer_name': logout['computer_name'],
-                    'login_time': None,
-                    'logout_time': logout['timestamp'].strftime("%H:%M:%S"),
-                    'duration_minutes': 0,
-                    'duration_hours': 0.0,
-                    'status': 'logout_only'
-                }
-                sessions.append(session)
-                logout_index += 1
-            
-            if sessions:
-                total_minutes = sum(s['duration_minutes'] for s in sessions if s['status'] == 'complete')
-                total_hours = round(total_minutes / 60, 2)
-                
-                self.sessions[student_id][date] = {
-                    'date': date,
-                    'weekday': logins[0]['weekday'] if logins else (logouts[0]['weekday'] if logouts else None),
-                    'total_sessions': len(sessions),
-                    'completed_sessions': len([s for s in sessions if s['status'] == 'complete']),
-                    'total_duration_minutes': total_minutes,
-                    'total_duration_hours': total_hours,
-                    'sessions': sessions
-                }
+        for student_id, date, day_record in records:
+            self.sessions[student_id][date] = day_record
     
     def generate_json_report(self, output_filepath):
         report = {
@@ -196,7 +305,10 @@ class StudentSessionTracker:
             student_data['total_sessions_all_days'] = total_sessions
             
             for date, day_data in sorted(dates.items()):
-                student_data['days'][date] = day_data
+                student_data['days'][date] = dict(day_data, sessions=[
+                    {key: value for key, value in session.items() if key not in JSON_EXCLUDED_SESSION_KEYS}
+                    for session in day_data['sessions']
+                ])
             
             report['students'][student_id] = student_data
         
@@ -206,10 +318,94 @@ class StudentSessionTracker:
         except Exception:
             pass
     
+    def iter_session_rows(self):
+        """Yield one flat row per session with typed date and full-precision timestamp values"""
+        for student_id in sorted(self.sessions):
+            dates = self.sessions[student_id]
+            for date, day_data in sorted(dates.items()):
+                day = datetime.strptime(date, "%Y-%m-%d").date()
+                for session in day_data['sessions']:
+                    yield {
+                        'student_id': student_id,
+                        'date': day,
+                        'session_number': session['session_number'],
+                        'computer_name': session['computer_name'],
+                        'login_timestamp': session['login_timestamp'],
+                        'logout_timestamp': session['logout_timestamp'],
+                        'duration_minutes': session['duration_minutes'],
+                        'duration_hours': session['duration_hours'],
+                        'status': session['status']
+                    }
+    
+    def export_sessions_csv(self, output_filepath):
+        """Stream one row per session to a CSV file with ISO 8601 dates and timestamps
+
+        On failure the partly written file is removed and the error is re-raised.
+        """
+        try:
+            with open(output_filepath, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(SESSION_COLUMNS)
+                for row in self.iter_session_rows():
+                    values = []
+                    for column in SESSION_COLUMNS:
+                        value = row[column]
+                        if value is None:
+                            value = ''
+                        elif isinstance(value, datetime):
+                            value = value.isoformat(timespec='microseconds')
+                        elif hasattr(value, 'isoformat'):
+                            value = value.isoformat()
+                        values.append(value)
+                    writer.writerow(values)
+        except Exception:
+            remove_partial_file(output_filepath)
+            raise
+    
+    def export_sessions_parquet(self, output_filepath, batch_size=50000):
+        """Write one row per session to a Parquet file in batches; returns False if pyarrow is missing
+
+        On failure the partly written file is removed and the error is re-raised.
+        """
+        if pa is None:
+            return False
+        
+        schema = pa.schema([
+            ('student_id', pa.string()),
+            ('date', pa.date32()),
+            ('session_number', pa.int32()),
+            ('computer_name', pa.string()),
+            ('login_timestamp', pa.timestamp('us')),
+            ('logout_timestamp', pa.timestamp('us')),
+            ('duration_minutes', pa.int32()),
+            ('duration_hours', pa.float64()),
+            ('status', pa.string())
+        ])
+        
+        try:
+            with pq.ParquetWriter(output_filepath, schema) as writer:
+                batch = []
+                for row in self.iter_session_rows():
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                        batch = []
+                if batch:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+        except Exception:
+            remove_partial_file(output_filepath)
+            raise
+        return True
+    
     def print_summary(self):
         pass
 
 def main():
+    parser = argparse.ArgumentParser(description="Build student_sessions.json from login/logout logs")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for sessionization (default 1 runs serially)")
+    args = parser.parse_args()
+    
     tracker = StudentSessionTracker()
     login_file = "login.txt"
     logout_file = "logoff.txt"
@@ -226,8 +422,15 @@ def main():
     
     tracker.remove_near_duplicates(threshold_seconds=1)
     
-    tracker.calculate_sessions()
+    tracker.calculate_sessions(workers=args.workers)
     tracker.generate_json_report(output_file)
+    
+    try:
+        tracker.export_sessions_csv("student_sessions.csv")
+        if not tracker.export_sessions_parquet("student_sessions.parquet"):
+            print("Note: pyarrow is not installed, skipping student_sessions.parquet.")
+    except Exception as e:
+        print(f"Error writing session export: {e}")
 
 if __name__ == "__main__":
     main()
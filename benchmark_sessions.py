@@ -0,0 +1,63 @@
+import argparse
+import copy
+import json
+import os
+import time
+
+from Generate_Json_Record import StudentSessionTracker
+
+
+def load_scaled_tracker(login_file, logout_file, scale):
+    """Load the log files, repeating every line scale times under distinct student IDs"""
+    tracker = StudentSessionTracker()
+    for filepath, target in ((login_file, tracker.login_data), (logout_file, tracker.logout_data)):
+        with open(filepath, 'r', encoding='utf-8') as file:
+            lines = file.readlines()
+        for copy_index in range(scale):
+            for line in lines:
+                parsed = tracker.parse_log_line(line)
+                if parsed:
+                    parsed['student_id'] = f"{parsed['student_id']}_{copy_index}"
+                    target.append(parsed)
+    tracker.remove_near_duplicates(threshold_seconds=1)
+    return tracker
+
+
+def time_sessions(base_tracker, workers):
+    """Run calculate_sessions on a copy of the loaded events and return (seconds, sessions)"""
+    tracker = StudentSessionTracker()
+    tracker.login_data = copy.copy(base_tracker.login_data)
+    tracker.logout_data = copy.copy(base_tracker.logout_data)
+
+    start = time.perf_counter()
+    tracker.calculate_sessions(workers=workers)
+    return time.perf_counter() - start, tracker.sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare serial and parallel sessionization")
+    parser.add_argument("--scale", type=int, default=50,
+                        help="How many times to repeat the bundled logs (default 50)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8],
+                        help="Worker counts to compare against the serial run")
+    args = parser.parse_args()
+
+    tracker = load_scaled_tracker("login.txt", "logoff.txt", args.scale)
+    num_events = len(tracker.login_data) + len(tracker.logout_data)
+    print(f"Events: {num_events}, available cores: {os.cpu_count()}")
+
+    serial_seconds, serial_sessions = time_sessions(tracker, 1)
+    serial_json = json.dumps(serial_sessions, default=str)
+    print(f"workers=1: {serial_seconds:.2f}s")
+
+    for workers in args.workers:
+        seconds, sessions = time_sessions(tracker, workers)
+        identical = json.dumps(sessions, default=str) == serial_json
+        print(f"workers={workers}: {seconds:.2f}s, speedup {serial_seconds / seconds:.2f}x, "
+              f"identical to serial: {identical}")
+        if not identical:
+            raise SystemExit(f"Parallel output with {workers} workers differs from serial output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import warnings
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+
+class CohortReportEngine:
+    """Cohort-wide reports built from a dense students x days hours matrix"""
+
+    def __init__(self, data):
+        self.data = data
+        self.student_ids = []
+        self.dates = []
+        self.hours = np.zeros((0, 0))
+        self.present = np.zeros((0, 0), dtype=bool)
+        self.build_matrix()
+
+    def build_matrix(self):
+        """Build the hours and attendance matrices from the session data in one pass"""
+        students = self.data.get('students', {}) if self.data else {}
+        self.student_ids = sorted(students)
+
+        rows, cols, values = [], [], []
+        first_day = last_day = None
+
+        for row, student_id in enumerate(self.student_ids):
+            for date_str, day_data in students[student_id]['days'].items():
+                day = datetime.strptime(date_str, "%Y-%m-%d").date()
+                if first_day is None or day < first_day:
+                    first_day = day
+                if last_day is None or day > last_day:
+                    last_day = day
+                rows.append(row)
+                cols.append(day.toordinal())
+                values.append(day_data['total_duration_hours'])
+
+        if first_day is None:
+            self.dates = []
+            self.hours = np.zeros((len(self.student_ids), 0))
+            self.present = np.zeros((len(self.student_ids), 0), dtype=bool)
+            return
+
+        # Dense calendar range so that weeks and streaks line up column-wise
+        num_days = (last_day - first_day).days + 1
+        self.dates = [first_day + timedelta(days=i) for i in range(num_days)]
+
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp) - first_day.toordinal()
+
+        self.hours = np.zeros((len(self.student_ids), num_days))
+        self.hours[rows, cols] = values
+        self.present = np.zeros((len(self.student_ids), num_days), dtype=bool)
+        self.present[rows, cols] = True
+
+    def _grouped_hours(self, keys):
+        """Sum matrix columns over runs of equal consecutive keys"""
+        if not self.dates:
+            return [], np.zeros((len(self.student_ids), 0))
+        keys = np.asarray(keys)
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        return keys[starts].tolist(), np.add.reduceat(self.hours, starts, axis=1)
+
+    def _hours_table(self, labels, grouped):
+        df = pd.DataFrame(np.round(grouped, 2), columns=labels)
+        df.insert(0, "Student ID", self.student_ids)
+        df["Total Hours"] = np.round(grouped.sum(axis=1), 2)
+        return df
+
+    def monthly_table(self):
+        """All-students hours per month"""
+        keys = [day.strftime("%m/%Y") for day in self.dates]
+        labels, grouped = self._grouped_hours(keys)
+        return self._hours_table(labels, grouped)
+
+    def weekly_table(self):
+        """All-students hours per week (Monday to Sunday)"""
+        keys = [(day - timedelta(days=day.weekday())).strftime("%d/%m/%Y") for day in self.dates]
+        labels, grouped = self._grouped_hours(keys)
+        return self._hours_table([f"Week of {label}" for label in labels], grouped)
+
+    def percentiles_table(self, percentiles=(50, 75, 90)):
+        """Per-student daily hour percentiles and cohort percentile rank of total hours"""
+        totals = self.hours.sum(axis=1)
+        active_days = self.present.sum(axis=1)
+
+        # Only days the student attended count towards their daily distribution
+        daily = np.where(self.present, self.hours, np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if self.dates:
+                daily_percentiles = np.nanpercentile(daily, percentiles, axis=1)
+            else:
+                daily_percentiles = np.full((len(percentiles), len(self.student_ids)), np.nan)
+
+        sorted_totals = np.sort(totals)
+        if len(totals):
+            rank = np.searchsorted(sorted_totals, totals, side='right') / len(totals) * 100
+        else:
+            rank = totals
+
+        df = pd.DataFrame({
+            "Student ID": self.student_ids,
+            "Active Days": active_days,
+            "Total Hours": np.round(totals, 2),
+        })
+        for p, values in zip(percentiles, daily_percentiles):
+            df[f"P{p} Hours/Day"] = np.round(np.nan_to_num(values), 2)
+        df["Cohort Percentile"] = np.round(rank, 1)
+        return df
+
+    def streaks_table(self):
+        """Longest and current attendance streaks, counted over days the lab was in use"""
+        lab_days = self.present.any(axis=0)
+        attended = self.present[:, lab_days]
+
+        if attended.shape[1] == 0:
+            longest = current = np.zeros(len(self.student_ids), dtype=int)
+        else:
+            # Running count of attended days, reset to zero on every missed day
+            counts = np.cumsum(attended, axis=1)
+            resets = np.maximum.accumulate(np.where(attended, 0, counts), axis=1)
+            runs = counts - resets
+            longest = runs.max(axis=1)
+            current = runs[:, -1]
+
+        return pd.DataFrame({
+            "Student ID": self.student_ids,
+            "Days Attended": attended.sum(axis=1),
+            "Lab Days": int(lab_days.sum()),
+            "Longest Streak": longest,
+            "Current Streak": current,
+        })
+
+    def top_k(self, k=10):
+        """Top K students by total hours using a partial sort"""
+        totals = self.hours.sum(axis=1)
+        n = len(totals)
+        k = min(k, n)
+        if k <= 0:
+            return pd.DataFrame(columns=["Rank", "Student ID", "Active Days", "Total Hours", "Avg Hours/Day"])
+
+        if k < n:
+            # Partial sort finds the K-th largest total; keep everyone tied with it so the
+            # student ID tie-break below decides who makes the cut, not argpartition
+            kth_value = totals[np.argpartition(-totals, k - 1)[k - 1]]
+            candidates = np.flatnonzero(totals >= kth_value)
+        else:
+            candidates = np.arange(n)
+        ids = np.asarray(self.student_ids)
+        # Order the candidates by hours descending, then student ID
+        order = candidates[np.lexsort((ids[candidates], -totals[candidates]))][:k]
+
+        active_days = self.present.sum(axis=1)[order]
+        top_totals = totals[order]
+        avg = np.divide(top_totals, active_days, out=np.zeros_like(top_totals), where=active_days > 0)
+
+        return pd.DataFrame({
+            "Rank": np.arange(1, k + 1),
+            "Student ID": ids[order],
+            "Active Days": active_days,
+            "Total Hours": np.round(top_totals, 2),
+            "Avg Hours/Day": np.round(avg, 2),
+        })
+
+    def export_to_excel(self, file_path, k=10):
+        """Write all cohort tables to a multi-sheet Excel workbook"""
+        with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
+            self.top_k(k).to_excel(writer, sheet_name=f"Top {k} Students", index=False)
+            self.monthly_table().to_excel(writer, sheet_name="Monthly Hours", index=False)
+            self.weekly_table().to_excel(writer, sheet_name="Weekly Hours", index=False)
+            self.percentiles_table().to_excel(writer, sheet_name="Percentiles", index=False)
+            self.streaks_table().to_excel(writer, sheet_name="Attendance Streaks", index=False)
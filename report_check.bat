@@ -17,7 +17,7 @@ if %errorlevel% neq 0 (
 REM Install required Python packages
 echo Installing required Python packages...
 python -m pip install --upgrade pip >nul
-python -m pip install tabulate pandas openpyxl >nul
+python -m pip install tabulate pandas numpy openpyxl >nul
 
 if %errorlevel% neq 0 (
     echo Error: Failed to install one or more Python packages.
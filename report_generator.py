@@ -1,14 +1,18 @@
+import argparse
 import json
 import pandas as pd
 import os
 from datetime import datetime, timedelta
 from tabulate import tabulate
 import calendar
+from cohort_report import CohortReportEngine
+from table_renderer import TableRenderer
 
 class StudentReportGenerator:
-    def __init__(self, json_file="student_sessions.json"):
+    def __init__(self, json_file="student_sessions.json", output_format="grid", page_size=50, output_dir=None):
         self.json_file = json_file
         self.data = None
+        self.renderer = TableRenderer(output_format=output_format, page_size=page_size, output_dir=output_dir)
         self.load_data()
     
     def load_data(self):
@@ -185,7 +189,7 @@ class StudentReportGenerator:
 
         headers = ["Date", "Session#", "Computer", "Login", "Logout", "Hours", "Minutes", "Status"]
         print("\nSESSION DETAILS:")
-        print(tabulate(all_sessions, headers=headers, tablefmt="grid"))
+        self.renderer.render(all_sessions, headers, name=f"{student_id}_sessions")
         
         
         # Ask if user wants to download Excel
@@ -199,21 +203,9 @@ class StudentReportGenerator:
             }
             df_summary = pd.DataFrame(summary_data)
 
-            # Ensure directory exists
-            output_dir = "../students_report"
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Base filename with date
+            # Base filename with date, auto-incremented if it already exists
             date_str = datetime.now().strftime("%Y-%m-%d")
-            base_filename = f"{student_id}_summary_{date_str}"
-            extension = ".xlsx"
-            file_path = os.path.join(output_dir, base_filename + extension)
-
-            # Auto-increment filename if it already exists
-            counter = 1
-            while os.path.exists(file_path):
-                file_path = os.path.join(output_dir, f"{base_filename}_{counter}{extension}")
-                counter += 1
+            file_path = self.get_report_path(f"{student_id}_summary_{date_str}")
 
             # Write to Excel
             with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
@@ -405,12 +397,12 @@ class StudentReportGenerator:
         
         print(f"\nSTUDENT USAGE SUMMARY:")
         headers = ["Student ID", "Active Days", "Total Sessions", "Total Hours", "Avg Hours/Day"]
-        print(tabulate(all_students_data, headers=headers, tablefmt="grid"))
+        self.renderer.render(all_students_data, headers, name="all_students_usage")
         
         # Top 10 students by usage
         if len(all_students_data) > 10:
             print(f"\nTOP 10 STUDENTS BY USAGE:")
-            print(tabulate(all_students_data[:10], headers=headers, tablefmt="grid"))
+            self.renderer.render(all_students_data[:10], headers, name="top_10_students")
             
          # Ask user if they want to download report
         choice = input("\nDo you want to download this report as an Excel file? (y/n): ").strip().lower()
@@ -419,21 +411,9 @@ class StudentReportGenerator:
             df_summary = pd.DataFrame(summary_data, columns=["Metric", "Value"])
             df_students = pd.DataFrame(all_students_data, columns=headers)
 
-            # Ensure output directory exists
-            output_dir = "../students_report"
-            os.makedirs(output_dir, exist_ok=True)
-
-            # Base filename with date
+            # Base filename with date, auto-incremented if it already exists
             date_str = datetime.now().strftime("%Y-%m-%d")
-            base_filename = f"all_students_summary_{date_str}"
-            extension = ".xlsx"
-            file_path = os.path.join(output_dir, base_filename + extension)
-
-            # Auto-increment filename if it already exists
-            counter = 1
-            while os.path.exists(file_path):
-                file_path = os.path.join(output_dir, f"{base_filename}_{counter}{extension}")
-                counter += 1
+            file_path = self.get_report_path(f"all_students_summary_{date_str}")
 
             # Write to Excel
             with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
@@ -444,6 +424,73 @@ class StudentReportGenerator:
         else:
             print("\nReturning to main menu...")
     
+    def get_report_path(self, base_filename, extension=".xlsx"):
+        """Return a path in the reports folder that does not overwrite an existing file"""
+        output_dir = "../students_report"
+        os.makedirs(output_dir, exist_ok=True)
+
+        file_path = os.path.join(output_dir, base_filename + extension)
+        counter = 1
+        while os.path.exists(file_path):
+            file_path = os.path.join(output_dir, f"{base_filename}_{counter}{extension}")
+            counter += 1
+        return file_path
+
+    def render_dataframe(self, df, name):
+        """Render a DataFrame with decimal values shown to 2 places, like the other reports"""
+        rows = [
+            [f"{value:.2f}" if isinstance(value, float) else value for value in row]
+            for row in df.values.tolist()
+        ]
+        self.renderer.render(rows, list(df.columns), name=name)
+
+    def generate_cohort_report(self):
+        """Generate monthly, weekly, percentile, streak and ranking tables for all students"""
+        if not self.data:
+            print("No data available.")
+            return
+
+        engine = CohortReportEngine(self.data)
+        if not engine.dates:
+            print("No session data available.")
+            return
+
+        print(f"\n{'='*80}")
+        print("COHORT USAGE REPORT")
+        start_display = engine.dates[0].strftime("%d/%m/%Y")
+        end_display = engine.dates[-1].strftime("%d/%m/%Y")
+        print(f"Period: {start_display} to {end_display}")
+        print(f"{'='*80}")
+
+        print(f"\nTOP 10 STUDENTS BY USAGE:")
+        df_top_10_students = engine.top_k(10)
+        self.render_dataframe(df_top_10_students, name="cohort_top_10_students")
+
+        print(f"\nMONTHLY HOURS (ALL STUDENTS):")
+        df_monthly_hours = engine.monthly_table()
+        self.render_dataframe(df_monthly_hours, name="cohort_monthly_hours")
+
+        print(f"\nWEEKLY HOURS (ALL STUDENTS):")
+        df_weekly_hours = engine.weekly_table()
+        self.render_dataframe(df_weekly_hours, name="cohort_weekly_hours")
+
+        print(f"\nDAILY HOURS PERCENTILES:")
+        df_percentiles = engine.percentiles_table()
+        self.render_dataframe(df_percentiles, name="cohort_percentiles")
+
+        print(f"\nATTENDANCE STREAKS:")
+        df_attendance_streaks = engine.streaks_table()
+        self.render_dataframe(df_attendance_streaks, name="cohort_attendance_streaks")
+
+        choice = input("\nDo you want to download this report as an Excel file? (y/n): ").strip().lower()
+        if choice == 'y':
+            date_str = datetime.now().strftime("%Y-%m-%d")
+            file_path = self.get_report_path(f"cohort_report_{date_str}")
+            engine.export_to_excel(file_path, k=10)
+            print(f"\n✅ Excel report saved as: {file_path}")
+        else:
+            print("\nReturning to main menu...")
+
     
     def show_menu(self):
         """Display main menu"""
@@ -456,6 +503,7 @@ class StudentReportGenerator:
         print("4. View Student Weekly Usage")
         print("5. Generate All Students Report")
         print("6. Exit")
+        print("7. Generate Cohort Report (Monthly/Weekly/Percentiles/Streaks)")
         print("-" * 50)
     
     def run(self):
@@ -465,7 +513,7 @@ class StudentReportGenerator:
         
         while True:
             self.show_menu()
-            choice = input("Enter your choice (1-6): ").strip()
+            choice = input("Enter your choice (1-7): ").strip()
             
             if choice == '1':
                 self.view_daily_usage()
@@ -480,8 +528,10 @@ class StudentReportGenerator:
             elif choice == '6':
                 print("Thank you for using Student Lab Usage Report System!")
                 break
+            elif choice == '7':
+                self.generate_cohort_report()
             else:
-                print("Invalid choice. Please enter 1-6.")
+                print("Invalid choice. Please enter 1-7.")
             
             input("\nPress Enter to continue...")
 
@@ -494,7 +544,17 @@ def main():
         print("Install it using: pip install tabulate")
         return
     
-    reporter = StudentReportGenerator()
+    parser = argparse.ArgumentParser(description="Student Lab Usage Report System")
+    parser.add_argument("--format", choices=TableRenderer.FORMATS, default="grid",
+                        help="Output format for large tables (use plain or csv when piping)")
+    parser.add_argument("--page-size", type=int, default=50,
+                        help="Rows per page for large tables on a terminal (0 disables paging)")
+    parser.add_argument("--output-dir", default=None,
+                        help="Write large tables to files in this folder instead of the console")
+    args = parser.parse_args()
+    
+    reporter = StudentReportGenerator(output_format=args.format, page_size=args.page_size,
+                                      output_dir=args.output_dir)
     reporter.run()
 
 # This script is designed to generate reports based on student lab usage data.
@@ -0,0 +1,116 @@
+import csv
+import os
+import sys
+
+
+class TableRenderer:
+    """Stream large tables to the console page by page instead of building one big string"""
+
+    FORMATS = ("grid", "plain", "csv")
+
+    def __init__(self, output_format="grid", page_size=50, stream=None, output_dir=None):
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unknown output format: {output_format}")
+        self.output_format = output_format
+        self.page_size = page_size
+        self.stream = stream or sys.stdout
+        self.output_dir = output_dir
+
+    def is_interactive(self):
+        """Only pause between pages when writing to a terminal"""
+        try:
+            return self.stream.isatty() and sys.stdin.isatty()
+        except (AttributeError, ValueError):
+            return False
+
+    @staticmethod
+    def format_cell(value):
+        return "" if value is None else str(value)
+
+    @staticmethod
+    def is_number(text):
+        try:
+            float(text)
+            return True
+        except ValueError:
+            return False
+
+    def compute_layout(self, headers, rows):
+        """Compute column widths and alignment in a single pass over the rows"""
+        widths = [len(self.format_cell(h)) for h in headers]
+        numeric = [True] * len(headers)
+        for row in rows:
+            for i, value in enumerate(row):
+                text = self.format_cell(value)
+                if len(text) > widths[i]:
+                    widths[i] = len(text)
+                if numeric[i] and text and not self.is_number(text):
+                    numeric[i] = False
+        return widths, numeric
+
+    def format_line(self, cells, widths, numeric, separator):
+        padded = []
+        for text, width, is_num in zip(cells, widths, numeric):
+            padded.append(text.rjust(width) if is_num else text.ljust(width))
+        if separator:
+            return f"| {' | '.join(padded)} |"
+        return "  ".join(padded).rstrip()
+
+    def wait_for_next_page(self):
+        """Return False if the user asked to stop paging"""
+        answer = input("-- More (Enter to continue, q to stop) -- ").strip().lower()
+        return answer != 'q'
+
+    def render(self, rows, headers, name=None):
+        """Write rows to the console, or to <output_dir>/<name> when an output folder is set
+
+        rows may be any iterable; it is materialized once because column widths
+        need a full pass before the first line can be written.
+        """
+        rows = list(rows)
+
+        if self.output_dir and name:
+            os.makedirs(self.output_dir, exist_ok=True)
+            extension = ".csv" if self.output_format == "csv" else ".txt"
+            file_path = os.path.join(self.output_dir, name + extension)
+            with open(file_path, 'w', encoding='utf-8', newline='') as file:
+                self.write_table(file, rows, headers, paging=False)
+            print(f"Table ({len(rows)} rows) written to: {file_path}")
+            return
+
+        paging = bool(self.page_size and self.page_size > 0 and self.is_interactive())
+        self.write_table(self.stream, rows, headers, paging)
+
+    def write_table(self, stream, rows, headers, paging):
+        """Write a materialized table to stream, pausing every page_size rows if paging"""
+        if self.output_format == "csv":
+            writer = csv.writer(stream, lineterminator="\n")
+            writer.writerow(headers)
+            writer.writerows(rows)
+            stream.flush()
+            return
+
+        widths, numeric = self.compute_layout(headers, rows)
+        grid = self.output_format == "grid"
+        header_cells = [self.format_cell(h) for h in headers]
+        border = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+        header_border = "+" + "+".join("=" * (w + 2) for w in widths) + "+"
+
+        write = stream.write
+        if grid:
+            write(border + "\n")
+            write(self.format_line(header_cells, widths, [False] * len(widths), True) + "\n")
+            write(header_border + "\n")
+        else:
+            write(self.format_line(header_cells, widths, numeric, False) + "\n")
+
+        for count, row in enumerate(rows, start=1):
+            cells = [self.format_cell(value) for value in row]
+            write(self.format_line(cells, widths, numeric, grid) + "\n")
+            if grid:
+                write(border + "\n")
+            if paging and count % self.page_size == 0 and count < len(rows):
+                stream.flush()
+                if not self.wait_for_next_page():
+                    break
+        stream.flush()
@@ -0,0 +1,35 @@
+import random
+
+from cohort_report import CohortReportEngine
+
+
+def make_data(hours_by_student):
+    """Minimal student_sessions.json structure with one day per student"""
+    return {
+        'students': {
+            student_id: {'days': {'2025-04-07': {'total_duration_hours': hours}}}
+            for student_id, hours in hours_by_student.items()
+        }
+    }
+
+
+def test_top_k_breaks_ties_at_boundary_by_student_id():
+    engine = CohortReportEngine(make_data({
+        'UT05': 3.0, 'UT01': 2.0, 'UT04': 2.0, 'UT02': 2.0, 'UT03': 1.0,
+    }))
+
+    top = engine.top_k(3)
+
+    assert top['Student ID'].tolist() == ['UT05', 'UT01', 'UT02']
+    assert top['Rank'].tolist() == [1, 2, 3]
+
+
+def test_top_k_matches_full_sort_with_ties():
+    rng = random.Random(0)
+    for _ in range(200):
+        hours = {f"UT{i:03d}": float(rng.randint(0, 5)) for i in range(40)}
+        engine = CohortReportEngine(make_data(hours))
+
+        expected = sorted(hours, key=lambda sid: (-hours[sid], sid))[:10]
+
+        assert engine.top_k(10)['Student ID'].tolist() == expected
@@ -0,0 +1,41 @@
+import csv
+from datetime import datetime
+
+from Generate_Json_Record import StudentSessionTracker
+
+
+def build_tracker():
+    tracker = StudentSessionTracker()
+    tracker.load_login_file("login.txt")
+    tracker.load_logout_file("logoff.txt")
+    tracker.remove_near_duplicates(threshold_seconds=1)
+    tracker.calculate_sessions()
+    return tracker
+
+
+def test_csv_timestamps_use_one_documented_format(tmp_path):
+    output = tmp_path / "sessions.csv"
+    build_tracker().export_sessions_csv(output)
+
+    with open(output, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    assert rows
+    for row in rows:
+        datetime.strptime(row['date'], "%Y-%m-%d")
+        for column in ('login_timestamp', 'logout_timestamp'):
+            if row[column]:
+                datetime.strptime(row[column], "%Y-%m-%dT%H:%M:%S.%f")
+
+
+def test_csv_durations_match_exported_timestamps(tmp_path):
+    output = tmp_path / "sessions.csv"
+    build_tracker().export_sessions_csv(output)
+
+    with open(output, encoding="utf-8", newline="") as file:
+        for row in csv.DictReader(file):
+            if row['status'] != 'complete':
+                continue
+            login = datetime.fromisoformat(row['login_timestamp'])
+            logout = datetime.fromisoformat(row['logout_timestamp'])
+            assert int((logout - login).total_seconds() / 60) == int(row['duration_minutes'])